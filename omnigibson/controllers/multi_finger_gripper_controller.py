@@ -101,6 +101,10 @@ class MultiFingerGripperController(GripperController):
             command_output_limits=command_output_limits,
         )
 
+        # Cache the finger joint position limits, which are used by the is_grasping heuristics every step
+        self._finger_min_pos = self._control_limits[ControlType.POSITION][0][self.dof_idx]
+        self._finger_max_pos = self._control_limits[ControlType.POSITION][1][self.dof_idx]
+
     def reset(self):
         # reset grasping state
         self._is_grasping = IsGraspingState.FALSE
@@ -152,22 +156,18 @@ class MultiFingerGripperController(GripperController):
 
         # If we're near the joint limits and we're using velocity / torque control, we zero out the action
         if self._motor_type in {"velocity", "torque"}:
-            violate_upper_limit = (
-                joint_pos > self._control_limits[ControlType.POSITION][1][self.dof_idx] - self._limit_tolerance
-            )
-            violate_lower_limit = (
-                joint_pos < self._control_limits[ControlType.POSITION][0][self.dof_idx] + self._limit_tolerance
-            )
+            violate_upper_limit = joint_pos > self._finger_max_pos - self._limit_tolerance
+            violate_lower_limit = joint_pos < self._finger_min_pos + self._limit_tolerance
             violation = np.logical_or(violate_upper_limit * (u > 0), violate_lower_limit * (u < 0))
             u *= ~violation
 
         # Update whether we're grasping or not
-        self._update_grasping_state(control_dict=control_dict)
+        self._update_grasping_state(control_dict=control_dict, finger_pos=joint_pos)
 
         # Return control
         return u
 
-    def _update_grasping_state(self, control_dict):
+    def _update_grasping_state(self, control_dict, finger_pos=None):
         """
         Updates internal inferred grasping state of the gripper being controlled by this gripper controller
 
@@ -177,6 +177,8 @@ class MultiFingerGripperController(GripperController):
 
                     joint_position: Array of current joint positions
                     joint_velocity: Array of current joint velocities
+            finger_pos (None or n-array): If specified, the current positions of the joints controlled by this
+                controller, which will be used instead of gathering them again from @control_dict
         """
         # Calculate grasping state based on mode of this controller
 
@@ -198,7 +200,8 @@ class MultiFingerGripperController(GripperController):
                 "gripper controller's tolerance of zero-ing out velocities, which makes the heuristics invalid."
             )
 
-            finger_pos = control_dict["joint_position"][self.dof_idx]
+            if finger_pos is None:
+                finger_pos = control_dict["joint_position"][self.dof_idx]
 
             # For joint position control, if the desired positions are the same as the current positions, is_grasping unknown
             if (
@@ -216,9 +219,7 @@ class MultiFingerGripperController(GripperController):
 
             # Otherwise, the last control signal intends to "move" the gripper
             else:
-                finger_vel = control_dict["joint_velocity"][self.dof_idx]
-                min_pos = self._control_limits[ControlType.POSITION][0][self.dof_idx]
-                max_pos = self._control_limits[ControlType.POSITION][1][self.dof_idx]
+                min_pos, max_pos = self._finger_min_pos, self._finger_max_pos
 
                 # Make sure we don't have any invalid values (i.e.: fingers should be within the limits)
                 assert np.all(
@@ -226,23 +227,21 @@ class MultiFingerGripperController(GripperController):
                 ), f"Got invalid finger joint positions when checking for grasp! " \
                    f"min: {min_pos}, max: {max_pos}, finger_pos: {finger_pos}"
 
-                # Check distance from both ends of the joint limits
-                dist_from_lower_limit = finger_pos - min_pos
-                dist_from_upper_limit = max_pos - finger_pos
-
-                # If the joint positions are not near the joint limits with some tolerance (m.POS_TOLERANCE)
+                # If the joint positions are not near the joint limits with some tolerance (m.POS_TOLERANCE),
+                # i.e.: the mean distance from both ends of the joint limits is large enough
+                mean_finger_pos = finger_pos.mean()
                 valid_grasp_pos = (
-                        np.mean(dist_from_lower_limit) > m.POS_TOLERANCE
-                        and np.mean(dist_from_upper_limit) > m.POS_TOLERANCE
+                        mean_finger_pos - min_pos.mean() > m.POS_TOLERANCE
+                        and max_pos.mean() - mean_finger_pos > m.POS_TOLERANCE
                 )
 
                 # And the joint velocities are close to zero with some tolerance (m.VEL_TOLERANCE)
-                valid_grasp_vel = np.all(np.abs(finger_vel) < m.VEL_TOLERANCE)
+                # Note that we only need to query the velocities if the position check passes
+                valid_grasp = valid_grasp_pos and \
+                    np.abs(control_dict["joint_velocity"][self.dof_idx]).max() < m.VEL_TOLERANCE
 
                 # Then the gripper is grasping something, which stops the gripper from reaching its desired state
-                is_grasping = (
-                    IsGraspingState.TRUE if valid_grasp_pos and valid_grasp_vel else IsGraspingState.FALSE
-                )
+                is_grasping = IsGraspingState.TRUE if valid_grasp else IsGraspingState.FALSE
 
         # Store calculated state
         self._is_grasping = is_grasping
@@ -93,8 +93,9 @@ def main(random_selection=False, headless=False, short_exec=False):
             "conditions": {
                 # For a specific particle system, this specifies what conditions are required in order for the
                 # particle applier / remover to apply / remover particles associated with that system
-                # The list should contain functions with signature condition() --> bool,
-                # where True means the condition is satisified
+                # The list should contain (ParticleModifyCondition, value) 2-tuples, which are compiled once into
+                # functions with signature condition(obj) --> bool, where True means the condition is satisfied.
+                # These are evaluated once per modification step for the whole object, not per particle
                 particle_type: [],
             },
             "projection_mesh_params": projection_mesh_params[method_type],
@@ -211,6 +212,8 @@ def main(random_selection=False, headless=False, short_exec=False):
     ]
     for t, delta in deltas:
         for i in range(t):
+            # Read back the modifier's position every step, since it may be a dynamic body that is also moved by
+            # physics (e.g.: gravity and contact with the table)
             modifier.set_position(modifier.get_position() + delta)
             env.step(np.array([]))
 
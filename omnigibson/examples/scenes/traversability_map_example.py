@@ -2,8 +2,6 @@ import os
 
 import cv2
 import matplotlib.pyplot as plt
-import numpy as np
-from PIL import Image
 
 import omnigibson as og
 from omnigibson.utils.asset_utils import get_og_scene_path, get_available_og_scenes
@@ -25,17 +23,19 @@ def main(random_selection=False, headless=False, short_exec=False):
     trav_map_size = 200
     trav_map_erosion = 2
 
-    trav_map = Image.open(os.path.join(get_og_scene_path(scene_model), "layout", "floor_trav_0.png"))
-    trav_map = np.array(trav_map.resize((trav_map_size, trav_map_size)))
-    trav_map = cv2.erode(trav_map, np.ones((trav_map_erosion, trav_map_erosion)))
+    # Decode and resize directly with OpenCV, which yields a uint8 array without any PIL -> numpy conversion
+    trav_map_path = os.path.join(get_og_scene_path(scene_model), "layout", "floor_trav_0.png")
+    trav_map = cv2.imread(trav_map_path, cv2.IMREAD_GRAYSCALE)
+    trav_map = cv2.resize(trav_map, (trav_map_size, trav_map_size), interpolation=cv2.INTER_NEAREST)
+    cv2.erode(trav_map, cv2.getStructuringElement(cv2.MORPH_RECT, (trav_map_erosion, trav_map_erosion)), dst=trav_map)
 
     if not headless:
-        plt.figure(figsize=(12, 12))
+        fig = plt.figure(figsize=(12, 12))
         plt.imshow(trav_map)
         plt.title(f"Traversable area of {scene_model} scene")
-
-    if not headless:
         plt.show()
+        # Release the figure once it's been displayed so repeated runs don't accumulate figures
+        plt.close(fig)
 
     # Shut down omnigibson at the end
     og.shutdown()
@@ -5,7 +5,6 @@ import sys
 import cv2
 import networkx as nx
 import numpy as np
-from PIL import Image
 
 from omnigibson.maps.map_base import BaseMap
 import omnigibson.utils.transform_utils as T
@@ -76,12 +75,18 @@ class TraversableMap(BaseMap):
         self.floor_heights = floor_heights
         self.floor_map = []
         map_size = None
+        # Erosion kernel is shared across floors. Use an integer structuring element so OpenCV can use its fast path
+        erosion_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (self.trav_map_erosion, self.trav_map_erosion)) \
+            if self.trav_map_erosion != 0 else None
         for floor in range(len(self.floor_heights)):
             if self.trav_map_with_objects:
                 # TODO: Shouldn't this be generated dynamically?
-                trav_map = np.array(Image.open(os.path.join(maps_path, "floor_trav_{}.png".format(floor))))
+                trav_map_path = os.path.join(maps_path, "floor_trav_{}.png".format(floor))
             else:
-                trav_map = np.array(Image.open(os.path.join(maps_path, "floor_trav_no_obj_{}.png".format(floor))))
+                trav_map_path = os.path.join(maps_path, "floor_trav_no_obj_{}.png".format(floor))
+            # Decode directly into a grayscale uint8 array so that the rest of the pipeline stays within OpenCV
+            trav_map = cv2.imread(trav_map_path, cv2.IMREAD_GRAYSCALE)
+            assert trav_map is not None, "Could not read trav map: {}".format(trav_map_path)
 
             # If we do not initialize the original size of the traversability map, we obtain it from the image
             # Then, we compute the final map size as the factor of scaling (default_resolution/resolution) times the
@@ -99,11 +104,12 @@ class TraversableMap(BaseMap):
 
             # We then erode the image. This is needed because the code that computes shortest path uses the global map
             # and a point robot
-            if self.trav_map_erosion != 0:
-                trav_map = cv2.erode(trav_map, np.ones((self.trav_map_erosion, self.trav_map_erosion)))
+            if erosion_kernel is not None:
+                cv2.erode(trav_map, erosion_kernel, dst=trav_map)
 
-            # We make the pixels of the image to be either 0 or 255
-            trav_map[trav_map < 255] = 0
+            # We make the pixels of the image to be either 0 or 255. This is done in-place in a single pass, which
+            # avoids allocating a temporary boolean mask
+            cv2.threshold(trav_map, 254, 255, cv2.THRESH_BINARY, dst=trav_map)
 
             # We search for the largest connected areas
             if self.build_graph:
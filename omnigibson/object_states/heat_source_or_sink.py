@@ -1,3 +1,4 @@
+import numpy as np
 from omnigibson.macros import create_module_macros, macros
 from omnigibson.object_states.aabb import AABB
 from omnigibson.object_states.inside import Inside
@@ -6,7 +7,6 @@ from omnigibson.object_states.object_state_base import AbsoluteObjectState
 from omnigibson.object_states.open_state import Open
 from omnigibson.object_states.toggle import ToggledOn
 from omnigibson.utils.python_utils import classproperty
-import omnigibson.utils.transform_utils as T
 
 
 # Create settings for this module
@@ -63,6 +63,8 @@ class HeatSourceOrSink(AbsoluteObjectState, LinkBasedStateMixin):
         super(HeatSourceOrSink, self).__init__(obj)
         self._temperature = temperature
         self._heating_rate = heating_rate
+        self._distance_threshold = None
+        self._distance_threshold_sq = None
         self.distance_threshold = distance_threshold
 
         # If the heat source needs to be toggled on, we assert the presence
@@ -139,6 +141,36 @@ class HeatSourceOrSink(AbsoluteObjectState, LinkBasedStateMixin):
         """
         return self._temperature
 
+    @property
+    def distance_threshold(self):
+        """
+        Returns:
+            float: Distance threshold which an object needs to be closer than in order to be affected by this
+                heat source / sink
+        """
+        return self._distance_threshold
+
+    @distance_threshold.setter
+    def distance_threshold(self, threshold):
+        """
+        Sets the distance threshold of this heat source / sink
+
+        Args:
+            threshold (float): Distance threshold to set
+        """
+        self._distance_threshold = threshold
+        # Cache the squared value as well so that proximity checks can skip the sqrt
+        self._distance_threshold_sq = float(threshold) ** 2
+
+    @property
+    def distance_threshold_sq(self):
+        """
+        Returns:
+            float: Squared distance threshold of this heat source / sink. Proximity checks should compare squared
+                distances against this value. This is kept in sync with @distance_threshold
+        """
+        return self._distance_threshold_sq
+
     @classmethod
     def get_dependencies(cls):
         deps = super().get_dependencies()
@@ -167,6 +199,15 @@ class HeatSourceOrSink(AbsoluteObjectState, LinkBasedStateMixin):
 
         return True
 
+    @property
+    def position(self):
+        """
+        Returns:
+            3-array: (x,y,z) position of this heat source's heating element
+        """
+        # Position is either the AABB center of the default link or the metalink position itself
+        return self.link.aabb_center if self.link == self._default_link else self.link.get_position()
+
     def affects_obj(self, obj):
         """
         Computes whether this heat source or sink object is affecting object @obj
@@ -192,9 +233,8 @@ class HeatSourceOrSink(AbsoluteObjectState, LinkBasedStateMixin):
         else:
             aabb_lower, aabb_upper = obj.states[AABB].get_value()
             obj_pos = (aabb_lower + aabb_upper) / 2.0
-            # Position is either the AABB center of the default link or the metalink position itself
-            heat_source_pos = self.link.aabb_center if self.link == self._default_link else self.link.get_position()
-            if T.l2_distance(heat_source_pos, obj_pos) > self.distance_threshold:
+            diff = self.position - obj_pos
+            if np.dot(diff, diff) > self.distance_threshold_sq:
                 return False
 
         # If all checks pass, we're actively influencing the object!
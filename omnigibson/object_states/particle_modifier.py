@@ -521,8 +521,9 @@ class ParticleModifier(IntrinsicObjectState, LinkBasedStateMixin, UpdateStateMix
             for system_name, conditions in self.conditions.items():
                 # Check if the system is active (for ParticleApplier, the system is always active)
                 if is_system_active(system_name):
-                    # Check if all conditions are met
-                    if np.all([condition(self.obj) for condition in conditions]):
+                    # Check if all conditions are met. Conditions are evaluated lazily, so we stop at the first one
+                    # that fails
+                    if all(condition(self.obj) for condition in conditions):
                         system = get_system(system_name)
                         # Update saturation limit if it's not specified yet
                         limit = self.visual_particle_modification_limit \
@@ -948,7 +949,7 @@ class ParticleApplier(ParticleModifier):
         # If we're about to check for modification, update whether it the visualization should be active or not
         if self.visualize and self._current_step == 0:
             # Only one system in our conditions, so next(iter()) suffices
-            is_active = bool(np.all([condition(self.obj) for condition in next(iter(self.conditions.values()))]))
+            is_active = all(condition(self.obj) for condition in next(iter(self.conditions.values())))
             self.projection_emitter.GetProperty("inputs:active").Set(is_active)
 
         # Run super
@@ -3,6 +3,7 @@ from omnigibson.macros import create_module_macros
 from omnigibson.object_states.heat_source_or_sink import HeatSourceOrSink
 from omnigibson.object_states.object_state_base import AbsoluteObjectState
 from omnigibson.object_states.aabb import AABB
+from omnigibson.object_states.inside import Inside
 from omnigibson.object_states.update_state_mixin import UpdateStateMixin
 import omnigibson as og
 
@@ -19,6 +20,10 @@ m.TEMPERATURE_DECAY_SPEED = 0.02  # per second. We'll do the conversion to steps
 
 
 class Temperature(AbsoluteObjectState, UpdateStateMixin):
+    # Active heat sources in the current scene, shared across all instances. See _get_heat_sources()
+    _HEAT_SOURCES = None
+    _HEAT_SOURCES_KEY = None
+
     @classmethod
     def get_dependencies(cls):
         deps = super().get_dependencies()
@@ -43,28 +48,93 @@ class Temperature(AbsoluteObjectState, UpdateStateMixin):
         self.value = new_value
         return True
 
-    def _update(self):
+    @classmethod
+    def _get_heat_sources(cls):
+        """
+        Returns:
+            dict: Table of all active heat sources / sinks in the current scene, stored as one array per attribute so
+                that they can all be swept at once. Maps:
+                    - "heat_sources": list of HeatSourceOrSink, the active heat sources
+                    - "obj_to_idx": dict mapping each heat source's object to its index in the table
+                    - "inside_idxs": array of indices of the heat sources that require objects to be inside them
+                    - "positions": (N, 3)-array of heating element positions (NaN for the heat sources that
+                        require objects to be inside them, so that they never pass the proximity check)
+                    - "thresholds_sq": N-array of squared distance thresholds
+                    - "temperatures": N-array of heat source temperatures
+                    - "heating_rates": N-array of heat source heating rates
+
+            This is shared across all Temperature instances, and only recomputed once per sim step or whenever the
+            scene / its heat source objects change
+        """
         # Avoid circular import
         from omnigibson.object_states.on_fire import OnFire
 
+        # Key on the scene and heat source objects as well as the sim step, since the step index alone does not change
+        # when e.g. the sim is stopped, the scene is cleared, or objects are imported / removed
+        scene = og.sim.scene
+        heat_source_objs = frozenset(scene.get_objects_with_state_recursive(HeatSourceOrSink))
+        key = (og.sim.current_time_step_index, scene, heat_source_objs)
+        if key != cls._HEAT_SOURCES_KEY:
+            heat_sources = []
+            for obj in heat_source_objs:
+                heat_source = obj.states.get(OnFire, obj.states.get(HeatSourceOrSink, None))
+                assert heat_source is not None, "Unknown HeatSourceOrSink subclass"
+                # Only active heat sources can affect other objects
+                if heat_source.get_value():
+                    heat_sources.append(heat_source)
+            n_heat_sources = len(heat_sources)
+            requires_inside = np.array([heat_source.requires_inside for heat_source in heat_sources], dtype=bool)
+            positions = np.full((n_heat_sources, 3), np.nan)
+            thresholds_sq = np.zeros(n_heat_sources)
+            for i in np.flatnonzero(~requires_inside):
+                positions[i] = heat_sources[i].position
+                thresholds_sq[i] = heat_sources[i].distance_threshold_sq
+            cls._HEAT_SOURCES = dict(
+                heat_sources=heat_sources,
+                obj_to_idx={heat_source.obj: i for i, heat_source in enumerate(heat_sources)},
+                inside_idxs=np.flatnonzero(requires_inside),
+                positions=positions,
+                thresholds_sq=thresholds_sq,
+                temperatures=np.array([heat_source.temperature for heat_source in heat_sources], dtype=float),
+                heating_rates=np.array([heat_source.heating_rate for heat_source in heat_sources], dtype=float),
+            )
+            cls._HEAT_SOURCES_KEY = key
+        return cls._HEAT_SOURCES
+
+    def _update(self):
         # Start at the current temperature.
         new_temperature = self.value
 
-        # Find all heat source objects.
+        # Find all active heat sources
+        table = self._get_heat_sources()
+        n_heat_sources = len(table["heat_sources"])
         affected_by_heat_source = False
-        heat_source_objs = og.sim.scene.get_objects_with_state_recursive(HeatSourceOrSink)
-        for obj2 in heat_source_objs:
-            # Only external heat sources will affect the temperature.
-            if obj2 == self.obj:
-                continue
+        if n_heat_sources > 0:
+            # Check which heat sources are close enough to this object in a single pass. This object's AABB is only
+            # needed if at least one active heat source uses the proximity check
+            if len(table["inside_idxs"]) < n_heat_sources:
+                aabb_lower, aabb_upper = self.obj.states[AABB].get_value()
+                diffs = table["positions"] - (aabb_lower + aabb_upper) / 2.0
+                affected = np.einsum("ij,ij->i", diffs, diffs) <= table["thresholds_sq"]
+            else:
+                affected = np.zeros(n_heat_sources, dtype=bool)
 
-            heat_source = obj2.states.get(OnFire, obj2.states.get(HeatSourceOrSink, None))
-            assert heat_source is not None, "Unknown HeatSourceOrSink subclass"
-
-            # Compute delta to apply if the heat source is actively affecting this object
-            if heat_source.affects_obj(obj=self.obj):
-                new_temperature += (heat_source.temperature - self.value) * heat_source.heating_rate * og.sim.get_rendering_dt()
-                affected_by_heat_source = True
+            # Only external heat sources will affect the temperature.
+            self_idx = table["obj_to_idx"].get(self.obj, None)
+            if self_idx is not None:
+                affected[self_idx] = False
+
+            # Heat sources that require the object to be inside are checked for that instead of proximity
+            for i in table["inside_idxs"]:
+                if i != self_idx:
+                    affected[i] = self.obj.states[Inside].get_value(table["heat_sources"][i].obj)
+
+            # Apply the deltas from all heat sources actively affecting this object at once
+            affected_by_heat_source = affected.any()
+            if affected_by_heat_source:
+                new_temperature += np.dot(
+                    table["temperatures"][affected] - self.value, table["heating_rates"][affected]
+                ) * og.sim.get_rendering_dt()
 
         # Apply temperature decay if not affected by any heat source.
         if not affected_by_heat_source:
@@ -22,6 +22,11 @@ m.CAN_TOGGLE_STEPS = 5
 
 
 class ToggledOn(AbsoluteObjectState, BooleanStateMixin, LinkBasedStateMixin, UpdateStateMixin):
+    # Prim paths of all robot finger links in the scene, shared across all instances. Refreshed once per sim step, as
+    # well as whenever the scene or its set of robots changes
+    _ROBOT_LINK_PATHS = frozenset()
+    _ROBOT_LINK_PATHS_KEY = None
+
     def __init__(self, obj, scale=None):
         self.scale = scale
         self.value = False
@@ -94,14 +99,32 @@ class ToggledOn(AbsoluteObjectState, BooleanStateMixin, LinkBasedStateMixin, Upd
 
         self._check_overlap = check_overlap
 
-    def _update(self):
+    @classmethod
+    def _get_robot_link_paths(cls):
+        """
+        Returns:
+            frozenset of str: Prim paths of all robot finger links in the current scene. This is shared across all
+                ToggledOn instances, and only recomputed once per sim step or whenever the scene / its robots change
+        """
         # Avoid circular imports
         from omnigibson.robots.manipulation_robot import ManipulationRobot
+
+        # Key on the scene and robots as well as the sim step, since the step index alone does not change when e.g.
+        # the sim is stopped, the scene is cleared, or a robot is imported
+        scene = og.sim.scene
+        robots = tuple(robot for robot in scene.robots if isinstance(robot, ManipulationRobot))
+        key = (og.sim.current_time_step_index, scene, robots)
+        if key != cls._ROBOT_LINK_PATHS_KEY:
+            cls._ROBOT_LINK_PATHS = frozenset(link.prim_path
+                                              for robot in robots
+                                              for finger_links in robot.finger_links.values()
+                                              for link in finger_links)
+            cls._ROBOT_LINK_PATHS_KEY = key
+        return cls._ROBOT_LINK_PATHS
+
+    def _update(self):
         # detect marker and hand interaction
-        self._robot_link_paths = set(link.prim_path
-                                     for robot in og.sim.scene.robots if isinstance(robot, ManipulationRobot)
-                                     for finger_links in robot.finger_links.values()
-                                     for link in finger_links)
+        self._robot_link_paths = self._get_robot_link_paths()
 
         # Check overlap
         robot_can_toggle = self._check_overlap() if len(self._robot_link_paths) > 0 else False
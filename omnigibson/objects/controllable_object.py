@@ -210,15 +210,20 @@ class ControllableObject(BaseObject):
         """
         controller_config = {} if custom_config is None else deepcopy(custom_config)
 
+        # Grab the defaults once, since these properties rebuild all of their nested configs on every access.
+        # merge_nested_dicts copies the base dict, so the defaults are not modified below
+        default_controllers = self._default_controllers
+        default_controller_config = self._default_controller_config
+
         # Update the configs
         for group in self.controller_order:
             group_controller_name = (
                 controller_config[group]["name"]
                 if group in controller_config and "name" in controller_config[group]
-                else self._default_controllers[group]
+                else default_controllers[group]
             )
             controller_config[group] = merge_nested_dicts(
-                base_dict=self._default_controller_config[group][group_controller_name],
+                base_dict=default_controller_config[group][group_controller_name],
                 extra_dict=controller_config.get(group, {}),
             )
 
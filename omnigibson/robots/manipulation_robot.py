@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 import numpy as np
 
 import omnigibson as og
@@ -43,6 +43,15 @@ AG_MODES = {
 }
 GraspingPoint = namedtuple("GraspingPoint", ["link_name", "position"])  # link_name (str), position (x,y,z tuple)
 
+# Identity (x,y,z,w) quaternion. Note that this is shared, so it should not be modified in place
+IDENTITY_QUAT = np.array([0, 0, 0, 1.0])
+
+# Default (delta pos, delta axis-angle) command output limits for the arm IK controllers. Note that these are shared,
+# so they should not be modified in place
+DEFAULT_IK_COMMAND_OUTPUT_LIMITS = (
+    np.array([-0.2, -0.2, -0.2, -0.5, -0.5, -0.5]),
+    np.array([0.2, 0.2, 0.2, 0.5, 0.5, 0.5]),
+)
 
 def can_assisted_grasp(obj):
     """
@@ -159,16 +168,37 @@ class ManipulationRobot(BaseRobot):
         # Initialize other variables used for assistive grasping
         self._ag_data = {arm: None for arm in self.arm_names}
         self._ag_freeze_joint_pos = {
-            arm: {} for arm in self.arm_names
-        }  # Frozen positions for keeping fingers held still
+            arm: None for arm in self.arm_names
+        }  # Frozen positions for keeping fingers held still, aligned with self.finger_joints[arm]
         self._ag_obj_in_hand = {arm: None for arm in self.arm_names}
         self._ag_obj_constraints = {arm: None for arm in self.arm_names}
         self._ag_obj_constraint_params = {arm: {} for arm in self.arm_names}
-        self._ag_freeze_gripper = {arm: None for arm in self.arm_names}
-        self._ag_release_counter = {arm: None for arm in self.arm_names}
+        # Per-arm flags / counters that are checked every step are stored as arrays indexed by arm index
+        self._arm_idx = {arm: i for i, arm in enumerate(self.arm_names)}
+        self._ag_freeze_gripper = np.zeros(len(self.arm_names), dtype=bool)
+        self._ag_release_counter = np.full(len(self.arm_names), -1, dtype=np.int32)  # -1 means not releasing
         self._ag_check_in_volume = {arm: None for arm in self.arm_names}
         self._ag_calculate_volume = {arm: None for arm in self.arm_names}
 
+        # Per-arm controller names, precomputed so that they aren't re-formatted every step
+        self._arm_controller_names = {arm: "arm_{}".format(arm) for arm in self.arm_names}
+        self._gripper_controller_names = {arm: "gripper_{}".format(arm) for arm in self.arm_names}
+
+        # Cached robot link info used by the per-step contact queries, filled in whenever links are updated
+        self._link_prim_paths_set = None
+        self._eef_links = None
+        self._finger_links = None
+        self._finger_link_prim_paths = None
+        self._finger_joints = None
+        self._finger_joint_idx = None
+
+        # Cached gripper controller references, indexed by arm index and filled in whenever controllers are loaded
+        self._gripper_controllers = None
+
+        # Cached arm / gripper control indices, filled in at initialization
+        self._arm_control_idx = None
+        self._gripper_control_idx = None
+
         # Call super() method
         super().__init__(
             prim_path=prim_path,
@@ -218,12 +248,58 @@ class ManipulationRobot(BaseRobot):
         # run super
         super()._validate_configuration()
 
+    def _load_controllers(self):
+        # Run super first
+        super()._load_controllers()
+
+        # Cache references to the gripper controllers, since these are queried every step. Missing controllers
+        # are caught separately in _validate_configuration
+        self._gripper_controllers = [
+            self._controllers.get(self._gripper_controller_names[arm]) for arm in self.arm_names
+        ]
+
+    def update_links(self, load_config=None):
+        # Run super first
+        super().update_links(load_config=load_config)
+
+        # Refresh the cached link info, since the underlying links may have been re-created
+        self._link_prim_paths_set = frozenset(self.link_prim_paths)
+        self._eef_links = {arm: self._links[self.eef_link_names[arm]] for arm in self.arm_names}
+        self._finger_links = {
+            arm: [self._links[link] for link in self.finger_link_names[arm]] for arm in self.arm_names
+        }
+        self._finger_link_prim_paths = {
+            arm: frozenset(link.prim_path for link in self._finger_links[arm]) for arm in self.arm_names
+        }
+
+    def update_joints(self):
+        # Run super first
+        super().update_joints()
+
+        # Refresh the cached joint info, since the underlying joints may have been re-created
+        self._finger_joints = {
+            arm: [self._joints[joint] for joint in self.finger_joint_names[arm]] for arm in self.arm_names
+        }
+        # Indices of the finger joints within the full joint position array
+        joint_names = list(self._joints.keys())
+        self._finger_joint_idx = {
+            arm: np.array([joint_names.index(joint) for joint in self.finger_joint_names[arm]], dtype=int)
+            for arm in self.arm_names
+        }
+
     def _initialize(self):
+        # Cache the arm / gripper control indices, since these are queried every step but rebuilt on every access.
+        # This must occur before running super, which already computes proprioception to load the observation space
+        self._arm_control_idx = {arm: np.array(self.arm_control_idx[arm]) for arm in self.arm_names}
+        self._gripper_control_idx = {arm: np.array(self.gripper_control_idx[arm]) for arm in self.arm_names}
+
         super()._initialize()
         if gm.AG_CLOTH:
             for arm in self.arm_names:
                 self._ag_check_in_volume[arm], self._ag_calculate_volume[arm] = \
-                    generate_points_in_volume_checker_function(obj=self, volume_link=self.eef_links[arm], mesh_name_prefixes="container")
+                    generate_points_in_volume_checker_function(
+                        obj=self, volume_link=self._eef_links[arm], mesh_name_prefixes="container"
+                    )
 
     def is_grasping(self, arm="default", candidate_obj=None):
         """
@@ -250,16 +326,15 @@ class ManipulationRobot(BaseRobot):
             )
             is_grasping = (
                 IsGraspingState.TRUE
-                if is_grasping_obj and self._ag_release_counter[arm] is None
+                if is_grasping_obj and self._ag_release_counter[self._arm_idx[arm]] == -1
                 else IsGraspingState.FALSE
             )
         else:
             # Infer from the gripper controller the state
-            is_grasping = self._controllers["gripper_{}".format(arm)].is_grasping()
+            is_grasping = self._gripper_controllers[self._arm_idx[arm]].is_grasping()
             # If candidate obj is not None, we also check to see if our fingers are in contact with the object
             if is_grasping and candidate_obj is not None:
-                finger_links = {link for link in self.finger_links[arm]}
-                is_grasping = len(candidate_obj.states[ContactBodies].get_value().intersection(finger_links)) > 0
+                is_grasping = not candidate_obj.states[ContactBodies].get_value().isdisjoint(self._finger_links[arm])
 
         return is_grasping
 
@@ -283,69 +358,73 @@ class ManipulationRobot(BaseRobot):
                     set of unique robot link prim_paths that it is in contact with
         """
         arm = self.default_arm if arm == "default" else arm
-        robot_contact_links = dict()
+        robot_contact_links = defaultdict(set)
         contact_data = set()
         # Find all objects in contact with all finger joints for this arm
-        con_results = [con for link in self.finger_links[arm] for con in link.contact_list()]
+        con_results = [con for link in self._finger_links[arm] for con in link.contact_list()]
 
         # Get robot contact links
-        link_paths = set(self.link_prim_paths)
+        link_paths = self._link_prim_paths_set
 
         for con_res in con_results:
-            # Only add this contact if it's not a robot self-collision
-            other_contact_set = {con_res.body0, con_res.body1} - link_paths
-            if len(other_contact_set) == 1:
-                link_contact, other_contact = (con_res.body0, con_res.body1) if \
-                    list(other_contact_set)[0] == con_res.body1 else (con_res.body1, con_res.body0)
+            # Only add this contact if it's not a robot self-collision, i.e.: exactly one of the two bodies is a
+            # robot link
+            body0_is_robot = con_res.body0 in link_paths
+            if body0_is_robot != (con_res.body1 in link_paths):
+                link_contact, other_contact = (con_res.body0, con_res.body1) if body0_is_robot else \
+                    (con_res.body1, con_res.body0)
                 # Add to contact data
                 contact_data.add((other_contact, tuple(con_res.position)) if return_contact_positions else other_contact)
                 # Also add robot contact link info
-                if other_contact not in robot_contact_links:
-                    robot_contact_links[other_contact] = set()
                 robot_contact_links[other_contact].add(link_contact)
 
-        return contact_data, robot_contact_links
+        return contact_data, dict(robot_contact_links)
 
     def set_position_orientation(self, position=None, orientation=None):
-        # Store the original EEF poses.
-        original_poses = {}
-        for arm in self.arm_names:
-            original_poses[arm] = (self.get_eef_position(arm), self.get_eef_orientation(arm))
+        # Store the original EEF poses, only for the hands that are holding an AG object
+        # get_position_orientation() already returns numpy arrays, so no further conversion is needed
+        original_poses = {
+            arm: self._eef_links[arm].get_position_orientation()
+            for arm in self.arm_names if self._ag_obj_in_hand[arm] is not None
+        }
 
         # Run the super method
         super().set_position_orientation(position=position, orientation=orientation)
 
         # Now for each hand, if it was holding an AG object, teleport it.
-        for arm in self.arm_names:
-            if self._ag_obj_in_hand[arm] is not None:
-                original_eef_pose = T.pose2mat(original_poses[arm])
-                inv_original_eef_pose = T.pose_inv(pose_mat=original_eef_pose)
-                original_obj_pose = T.pose2mat(self._ag_obj_in_hand[arm].get_position_orientation())
-                new_eef_pose = T.pose2mat((self.get_eef_position(arm), self.get_eef_orientation(arm)))
-                # New object pose is transform:
-                # original --> "De"transform the original EEF pose --> "Re"transform the new EEF pose
-                new_obj_pose = new_eef_pose @ inv_original_eef_pose @ original_obj_pose
-                self._ag_obj_in_hand[arm].set_position_orientation(*T.mat2pose(hmat=new_obj_pose))
+        for arm, original_pose in original_poses.items():
+            original_eef_pose = T.pose2mat(original_pose)
+            inv_original_eef_pose = T.pose_inv(pose_mat=original_eef_pose)
+            original_obj_pose = T.pose2mat(self._ag_obj_in_hand[arm].get_position_orientation())
+            new_eef_pose = T.pose2mat(self._eef_links[arm].get_position_orientation())
+            # New object pose is transform:
+            # original --> "De"transform the original EEF pose --> "Re"transform the new EEF pose
+            new_obj_pose = new_eef_pose @ inv_original_eef_pose @ original_obj_pose
+            self._ag_obj_in_hand[arm].set_position_orientation(*T.mat2pose(hmat=new_obj_pose))
 
     def apply_action(self, action):
-        # First run assisted grasping
+        # Assisted grasping (and therefore gripper freezing) is never active when using physical grasping, so we can
+        # skip all of its bookkeeping entirely in that case
         if self.grasping_mode != "physical":
+            # First run assisted grasping
             self._handle_assisted_grasping(action=action)
 
-        # Potentially freeze gripper joints
-        for arm in self.arm_names:
-            if self._ag_freeze_gripper[arm]:
-                self._freeze_gripper(arm)
+            # Potentially freeze gripper joints
+            if self._ag_freeze_gripper.any():
+                for arm in self.arm_names:
+                    if self._ag_freeze_gripper[self._arm_idx[arm]]:
+                        self._freeze_gripper(arm)
 
         # Run super method as normal
         super().apply_action(action)
 
     def deploy_control(self, control, control_type, indices=None, normalized=False):
         # We intercept the gripper control and replace it with the current joint position if we're freezing our gripper
-        for arm in self.arm_names:
-            if self._ag_freeze_gripper[arm]:
-                control[self.gripper_control_idx[arm]] = self._ag_obj_constraint_params[arm]["gripper_pos"] if \
-                    self.controllers[f"gripper_{arm}"].control_type == ControlType.POSITION else 0.0
+        if self.grasping_mode != "physical" and self._ag_freeze_gripper.any():
+            for arm in self.arm_names:
+                if self._ag_freeze_gripper[self._arm_idx[arm]]:
+                    control[self._gripper_control_idx[arm]] = self._ag_obj_constraint_params[arm]["gripper_pos"] if \
+                        self._gripper_controllers[self._arm_idx[arm]].control_type == ControlType.POSITION else 0.0
 
         super().deploy_control(control=control, control_type=control_type, indices=indices, normalized=normalized)
 
@@ -364,8 +443,8 @@ class ManipulationRobot(BaseRobot):
         self._ag_data[arm] = None
         self._ag_obj_constraints[arm] = None
         self._ag_obj_constraint_params[arm] = {}
-        self._ag_freeze_gripper[arm] = False
-        self._ag_release_counter[arm] = 0
+        self._ag_freeze_gripper[self._arm_idx[arm]] = False
+        self._ag_release_counter[self._arm_idx[arm]] = 0
 
     def release_grasp_immediately(self):
         """
@@ -375,7 +454,8 @@ class ManipulationRobot(BaseRobot):
         for arm in self.arm_names:
             if self._ag_obj_in_hand[arm] is not None:
                 self._release_grasp(arm=arm)
-                self._ag_release_counter[arm] = int(np.ceil(m.RELEASE_WINDOW / og.sim.get_rendering_dt()))
+                self._ag_release_counter[self._arm_idx[arm]] = \
+                    int(np.ceil(m.RELEASE_WINDOW / og.sim.get_rendering_dt()))
                 self._handle_release_window(arm=arm)
                 # TODO: Verify not needed!
                 # for finger_link in self.finger_links[arm]:
@@ -385,9 +465,9 @@ class ManipulationRobot(BaseRobot):
         # In addition to super method, add in EEF states
         dic = super().get_control_dict()
 
-        for arm in self.arm_names:
-            dic["eef_{}_pos_relative".format(arm)] = self.get_relative_eef_position(arm)
-            dic["eef_{}_quat_relative".format(arm)] = self.get_relative_eef_orientation(arm)
+        for arm, (rel_eef_pos, rel_eef_quat) in self.get_relative_eef_poses().items():
+            dic[f"eef_{arm}_pos_relative"] = rel_eef_pos
+            dic[f"eef_{arm}_quat_relative"] = rel_eef_quat
 
         return dic
 
@@ -397,21 +477,32 @@ class ManipulationRobot(BaseRobot):
         # Loop over all arms to grab proprio info
         joint_positions = self.get_joint_positions(normalized=False)
         joint_velocities = self.get_joint_velocities(normalized=False)
+
+        # Relative eef poses for all arms are computed together the first time any of them is requested
+        rel_eef_poses = dict()
+
+        def get_rel_eef_pose(arm):
+            if not rel_eef_poses:
+                rel_eef_poses.update(self.get_relative_eef_poses())
+            return rel_eef_poses[arm]
+
         for arm in self.arm_names:
-            # Add arm info
-            dic["arm_{}_qpos".format(arm)] = joint_positions[self.arm_control_idx[arm]]
-            dic["arm_{}_qpos_sin".format(arm)] = np.sin(joint_positions[self.arm_control_idx[arm]])
-            dic["arm_{}_qpos_cos".format(arm)] = np.cos(joint_positions[self.arm_control_idx[arm]])
-            dic["arm_{}_qvel".format(arm)] = joint_velocities[self.arm_control_idx[arm]]
-
-            # Add eef and grasping info
-            dic["eef_{}_pos_global".format(arm)] = self.get_eef_position(arm)
-            dic["eef_{}_quat_global".format(arm)] = self.get_eef_orientation(arm)
-            dic["eef_{}_pos".format(arm)] = self.get_relative_eef_position(arm)
-            dic["eef_{}_quat".format(arm)] = self.get_relative_eef_orientation(arm)
-            dic["grasp_{}".format(arm)] = np.array([self.is_grasping(arm)])
-            dic["gripper_{}_qpos".format(arm)] = joint_positions[self.gripper_control_idx[arm]]
-            dic["gripper_{}_qvel".format(arm)] = joint_velocities[self.gripper_control_idx[arm]]
+            # Add arm info -- the arm joint positions are only gathered once
+            arm_qpos = joint_positions[self._arm_control_idx[arm]]
+            dic[f"arm_{arm}_qpos"] = arm_qpos
+            dic[f"arm_{arm}_qpos_sin"] = np.sin(arm_qpos)
+            dic[f"arm_{arm}_qpos_cos"] = np.cos(arm_qpos)
+            dic[f"arm_{arm}_qvel"] = joint_velocities[self._arm_control_idx[arm]]
+
+            # Add eef and grasping info. These require querying link poses / grasping state, so they are only
+            # computed if they are actually requested
+            dic.set_lazy(f"eef_{arm}_pos_global", lambda arm=arm: self.get_eef_position(arm))
+            dic.set_lazy(f"eef_{arm}_quat_global", lambda arm=arm: self.get_eef_orientation(arm))
+            dic.set_lazy(f"eef_{arm}_pos", lambda arm=arm: get_rel_eef_pose(arm)[0])
+            dic.set_lazy(f"eef_{arm}_quat", lambda arm=arm: get_rel_eef_pose(arm)[1])
+            dic.set_lazy(f"grasp_{arm}", lambda arm=arm: np.array([self.is_grasping(arm)]))
+            dic[f"gripper_{arm}_qpos"] = joint_positions[self._gripper_control_idx[arm]]
+            dic[f"gripper_{arm}_qvel"] = joint_velocities[self._gripper_control_idx[arm]]
 
         return dic
 
@@ -572,7 +663,9 @@ class ManipulationRobot(BaseRobot):
             dict: Dictionary mapping arm appendage name to robot link corresponding to that arm's
                 eef link
         """
-        return {arm: self._links[self.eef_link_names[arm]] for arm in self.arm_names}
+        assert self._eef_links is not None, "Links must be loaded before querying eef_links!"
+        # Return a copy so that the internal cache cannot be modified externally
+        return dict(self._eef_links)
 
     @property
     def finger_links(self):
@@ -581,7 +674,9 @@ class ManipulationRobot(BaseRobot):
             dict: Dictionary mapping arm appendage name to robot links corresponding to
                 that arm's finger links
         """
-        return {arm: [self._links[link] for link in self.finger_link_names[arm]] for arm in self.arm_names}
+        assert self._finger_links is not None, "Links must be loaded before querying finger_links!"
+        # Return a copy so that the internal cache cannot be modified externally
+        return {arm: list(links) for arm, links in self._finger_links.items()}
 
     @property
     def finger_joints(self):
@@ -590,7 +685,9 @@ class ManipulationRobot(BaseRobot):
             dict: Dictionary mapping arm appendage name to robot joints corresponding to
                 that arm's finger joints
         """
-        return {arm: [self._joints[joint] for joint in self.finger_joint_names[arm]] for arm in self.arm_names}
+        assert self._finger_joints is not None, "Joints must be loaded before querying finger_joints!"
+        # Return a copy so that the internal cache cannot be modified externally
+        return {arm: list(joints) for arm, joints in self._finger_joints.items()}
 
     @property
     def assisted_grasp_start_points(self):
@@ -644,7 +741,7 @@ class ManipulationRobot(BaseRobot):
                 to arm @arm
         """
         arm = self.default_arm if arm == "default" else arm
-        return self._links[self.eef_link_names[arm]].get_position()
+        return self._eef_links[arm].get_position()
 
     def get_eef_orientation(self, arm="default"):
         """
@@ -657,7 +754,7 @@ class ManipulationRobot(BaseRobot):
                 to arm @arm
         """
         arm = self.default_arm if arm == "default" else arm
-        return self._links[self.eef_link_names[arm]].get_orientation()
+        return self._eef_links[arm].get_orientation()
 
     def get_relative_eef_pose(self, arm="default", mat=False):
         """
@@ -671,11 +768,30 @@ class ManipulationRobot(BaseRobot):
                 matrix form (if @mat=True) or (pos, quat) tuple (if @mat=False), corresponding to arm @arm
         """
         arm = self.default_arm if arm == "default" else arm
-        eef_link_pose = self.eef_links[arm].get_position_orientation()
-        base_link_pose = self.get_position_orientation()
-        pose = T.relative_pose_transform(*eef_link_pose, *base_link_pose)
+        pose = self.get_relative_eef_poses(arms=[arm])[arm]
         return T.pose2mat(pose) if mat else pose
 
+    def get_relative_eef_poses(self, arms=None):
+        """
+        Computes the end-effector poses for multiple arms at once, so that the robot base pose only needs to be
+        queried once
+
+        Args:
+            arms (None or list of str): specific arms to grab eef poses for. Default is None, which corresponds to
+                all arms in self.arm_names
+
+        Returns:
+            dict: Dictionary mapping each arm name to its (pos, quat) end-effector pose relative to the robot base frame
+        """
+        arms = self.arm_names if arms is None else arms
+        base_link_pos, base_link_quat = self.get_position_orientation()
+        return {
+            arm: T.relative_pose_transform(
+                *self._eef_links[arm].get_position_orientation(), base_link_pos, base_link_quat
+            )
+            for arm in arms
+        }
+
     def get_relative_eef_position(self, arm="default"):
         """
         Args:
@@ -726,41 +842,35 @@ class ManipulationRobot(BaseRobot):
         else:
             raise ValueError("Invalid grasping mode for calculating in hand object: {}".format(self.grasping_mode))
 
+        # Prune candidates with the cheap checks first, before querying any candidate poses. Only keep candidate
+        # links that are touching at least two fingers and belong to an object that can be assisted grasped
+        finger_prim_paths = self._finger_link_prim_paths[arm]
+        candidates = []
+        for prim_path in candidates_set:
+            if len(finger_prim_paths.intersection(robot_contact_links[prim_path])) < 2:
+                continue
+            # TODO: Better heuristic, hacky, we assume the parent object prim path is the prim_path minus the last
+            # "/" item
+            obj_prim_path, link_name = prim_path.rsplit("/", 1)
+            obj = og.sim.scene.object_registry("prim_path", obj_prim_path)
+            if obj is not None and can_assisted_grasp(obj):
+                candidates.append((prim_path, obj, link_name))
+
         # Immediately return if there are no valid candidates
-        if len(candidates_set) == 0:
+        if len(candidates) == 0:
             return None
 
         # Find the closest object to the gripper center
-        gripper_center_pos = self.eef_links[arm].get_position()
+        gripper_center_pos = self._eef_links[arm].get_position()
 
-        candidate_data = []
-        for prim_path in candidates_set:
-            # Calculate position of the object link
-            # Note: this assumes the simulator is playing!
-            rb_handle = self._dc.get_rigid_body(prim_path)
-            pose = self._dc.get_rigid_body_pose(rb_handle)
-            link_pos = np.asarray(pose.p)
-            dist = np.linalg.norm(np.array(link_pos) - np.array(gripper_center_pos))
-            candidate_data.append((prim_path, dist))
-
-        candidate_data = sorted(candidate_data, key=lambda x: x[-1])
-        ag_prim_path, _ = candidate_data[0]
-
-        # Make sure the ag_prim_path is not a self collision
-        assert ag_prim_path not in self.link_prim_paths, "assisted grasp object cannot be the robot itself!"
-
-        # Make sure at least two fingers are in contact with this object
-        robot_contacts = robot_contact_links[ag_prim_path]
-        touching_at_least_two_fingers = len({link.prim_path for link in self.finger_links[arm]}.intersection(robot_contacts)) >= 2
-
-        # TODO: Better heuristic, hacky, we assume the parent object prim path is the prim_path minus the last "/" item
-        ag_obj_prim_path = "/".join(ag_prim_path.split("/")[:-1])
-        ag_obj_link_name = ag_prim_path.split("/")[-1]
-        ag_obj = og.sim.scene.object_registry("prim_path", ag_obj_prim_path)
-
-        # Return None if object cannot be assisted grasped or not touching at least two fingers
-        if ag_obj is None or (not can_assisted_grasp(ag_obj)) or (not touching_at_least_two_fingers):
-            return None
+        # Grab the positions of all candidate object links, and pick the one closest to the gripper center
+        # Note: this assumes the simulator is playing!
+        candidate_pos = np.array([
+            self._dc.get_rigid_body_pose(self._dc.get_rigid_body(prim_path)).p for prim_path, _, _ in candidates
+        ])
+        candidate_diffs = candidate_pos - gripper_center_pos
+        _, ag_obj, ag_obj_link_name = \
+            candidates[np.argmin(np.einsum("ij,ij->i", candidate_diffs, candidate_diffs))]
 
         # Get object and its contacted link
         return ag_obj, ag_obj.links[ag_obj_link_name]
@@ -774,15 +884,16 @@ class ManipulationRobot(BaseRobot):
                 Default is "default" which corresponds to the first entry in self.arm_names
         """
         arm = self.default_arm if arm == "default" else arm
-        self._ag_release_counter[arm] += 1
-        time_since_release = self._ag_release_counter[arm] * og.sim.get_rendering_dt()
+        arm_idx = self._arm_idx[arm]
+        self._ag_release_counter[arm_idx] += 1
+        time_since_release = self._ag_release_counter[arm_idx] * og.sim.get_rendering_dt()
         if time_since_release >= m.RELEASE_WINDOW:
             # TODO: Verify not needed!
             # Remove filtered collision restraints
             # for finger_link in self.finger_links[arm]:
             #     finger_link.remove_filtered_collision_pair(prim=self._ag_obj_in_hand[arm])
             self._ag_obj_in_hand[arm] = None
-            self._ag_release_counter[arm] = None
+            self._ag_release_counter[arm_idx] = -1
 
     def _freeze_gripper(self, arm="default"):
         """
@@ -793,8 +904,7 @@ class ManipulationRobot(BaseRobot):
                 Default is "default" which corresponds to the first entry in self.arm_names
         """
         arm = self.default_arm if arm == "default" else arm
-        for joint_name, j_val in self._ag_freeze_joint_pos[arm].items():
-            joint = self._joints[joint_name]
+        for joint, j_val in zip(self._finger_joints[arm], self._ag_freeze_joint_pos[arm]):
             joint.set_pos(pos=j_val)
             joint.set_vel(vel=0.0)
 
@@ -846,10 +956,7 @@ class ManipulationRobot(BaseRobot):
                 "default_joint_pos": self.default_joint_pos,
                 "control_limits": self.control_limits,
                 "dof_idx": self.arm_control_idx[arm],
-                "command_output_limits": (
-                    np.array([-0.2, -0.2, -0.2, -0.5, -0.5, -0.5]),
-                    np.array([0.2, 0.2, 0.2, 0.5, 0.5, 0.5]),
-                ),
+                "command_output_limits": DEFAULT_IK_COMMAND_OUTPUT_LIMITS,
                 "kv": 2.0,
                 "mode": "pose_delta_ori",
                 "smoothing_filter_size": 2,
@@ -1007,18 +1114,18 @@ class ManipulationRobot(BaseRobot):
         # Need to find distance between robot and contact point in robot link's local frame and
         # ag link and contact point in ag link's local frame
         joint_frame_pos = contact_pos
-        joint_frame_orn = np.array([0, 0, 0, 1.0])
-        eef_link_pos, eef_link_orn = self.eef_links[arm].get_position_orientation()
+        joint_frame_orn = IDENTITY_QUAT
+        eef_link_pos, eef_link_orn = self._eef_links[arm].get_position_orientation()
         parent_frame_pos, parent_frame_orn = T.relative_pose_transform(joint_frame_pos, joint_frame_orn, eef_link_pos, eef_link_orn)
         obj_link_pos, obj_link_orn = ag_link.get_position_orientation()
         child_frame_pos, child_frame_orn = T.relative_pose_transform(joint_frame_pos, joint_frame_orn, obj_link_pos, obj_link_orn)
 
         # Create the joint
-        joint_prim_path = f"{self.eef_links[arm].prim_path}/ag_constraint"
+        joint_prim_path = f"{self._eef_links[arm].prim_path}/ag_constraint"
         joint_prim = create_joint(
             prim_path=joint_prim_path,
             joint_type=joint_type,
-            body0=self.eef_links[arm].prim_path,
+            body0=self._eef_links[arm].prim_path,
             body1=ag_link.prim_path,
             enabled=True,
             joint_frame_in_parent_frame_pos=parent_frame_pos / self.scale,
@@ -1035,23 +1142,23 @@ class ManipulationRobot(BaseRobot):
         max_force = m.ASSIST_FORCE if joint_type == "FixedJoint" else m.ASSIST_FORCE * m.ARTICULATED_ASSIST_FRACTION
         # joint_prim.GetAttribute("physics:breakForce").Set(max_force)
 
+        # Grab all joint positions at once, which are used for both the gripper and finger joint positions below
+        joint_positions = self.get_joint_positions()
         self._ag_obj_constraint_params[arm] = {
             "ag_obj_prim_path": ag_obj.prim_path,
             "ag_link_prim_path": ag_link.prim_path,
             "ag_joint_prim_path": joint_prim_path,
             "joint_type": joint_type,
-            "gripper_pos": self.get_joint_positions()[self.gripper_control_idx[arm]],
+            "gripper_pos": joint_positions[self._gripper_control_idx[arm]],
             "max_force": max_force,
         }
         self._ag_obj_in_hand[arm] = ag_obj
-        self._ag_freeze_gripper[arm] = True
+        self._ag_freeze_gripper[self._arm_idx[arm]] = True
         # Disable collisions while picking things up
         # TODO: Verify not needed!
         # for finger_link in self.finger_links[arm]:
         #     finger_link.add_filtered_collision_pair(prim=ag_obj)
-        for joint in self.finger_joints[arm]:
-            j_val = joint.get_state()[0][0]
-            self._ag_freeze_joint_pos[arm][joint.joint_name] = j_val
+        self._ag_freeze_joint_pos[arm] = joint_positions[self._finger_joint_idx[arm]]
 
     def _handle_assisted_grasping(self, action):
         """
@@ -1060,21 +1167,27 @@ class ManipulationRobot(BaseRobot):
         Args:
             action (n-array): gripper action to apply. >= 0 is release (open), < 0 is grasp (close).
         """
+        # controller_action_idx is rebuilt on every access, so only grab it once
+        controller_action_idx = self.controller_action_idx
+
         # Loop over all arms
-        for arm in self.arm_names:
+        for arm_idx, arm in enumerate(self.arm_names):
+            gripper_controller = self._gripper_controllers[arm_idx]
+
             # Make sure gripper action dimension is only 1
-            cmd_dim = self._controllers[f"gripper_{arm}"].command_dim
+            cmd_dim = gripper_controller.command_dim
             assert cmd_dim == 1, \
                 f"Gripper {arm} controller command dim must be 1 to use assisted grasping, got: {cmd_dim}."
 
             # TODO: Why are we separately checking for complementary conditions?
-            threshold = np.mean(self._controllers[f"gripper_{arm}"].command_input_limits)
-            applying_grasp = action[self.controller_action_idx[f"gripper_{arm}"][0]] < threshold
-            releasing_grasp = action[self.controller_action_idx[f"gripper_{arm}"][0]] > threshold
+            threshold = np.mean(gripper_controller.command_input_limits)
+            gripper_action = action[controller_action_idx[self._gripper_controller_names[arm]][0]]
+            applying_grasp = gripper_action < threshold
+            releasing_grasp = gripper_action > threshold
 
             # Execute gradual release of object
             if self._ag_obj_in_hand[arm]:
-                if self._ag_release_counter[arm] is not None:
+                if self._ag_release_counter[arm_idx] != -1:
                     self._handle_release_window(arm=arm)
                 else:
                     # constraint_violated = (
@@ -1103,8 +1216,10 @@ class ManipulationRobot(BaseRobot):
                 Default is "default" which corresponds to the first entry in self.arm_names
         """
         attachment_point_pos_local = self._ag_obj_constraint_params[arm]["attachment_point_pos_local"]
-        eef_link_pos, eef_link_orn = self.eef_links[arm].get_position_orientation()
-        attachment_point_pos, _ = T.pose_transform(eef_link_pos, eef_link_orn, attachment_point_pos_local, [0, 0, 0, 1])
+        eef_link_pos, eef_link_orn = self._eef_links[arm].get_position_orientation()
+        attachment_point_pos, _ = T.pose_transform(
+            eef_link_pos, eef_link_orn, attachment_point_pos_local, IDENTITY_QUAT
+        )
         joint_prim = self._ag_obj_constraints[arm]
         joint_prim.GetAttribute("physics:localPos1").Set(Gf.Vec3f(*attachment_point_pos.astype(float)))
 
@@ -1144,7 +1259,7 @@ class ManipulationRobot(BaseRobot):
         """
         # TODO (eric): Assume joint_pos = 0 means fully closed
         GRIPPER_FINGER_CLOSE_THRESHOLD = 0.03
-        gripper_finger_pos = self.get_joint_positions()[self.gripper_control_idx[arm]]
+        gripper_finger_pos = self.get_joint_positions()[self._gripper_control_idx[arm]]
         gripper_finger_close = np.sum(gripper_finger_pos) < GRIPPER_FINGER_CLOSE_THRESHOLD
         if not gripper_finger_close:
             return None
@@ -1193,9 +1308,9 @@ class ManipulationRobot(BaseRobot):
         ag_obj, ag_link, attachment_point_pos = ag_data
 
         # Find the attachment point position in the eef frame
-        eef_link_pos, eef_link_orn = self.eef_links[arm].get_position_orientation()
+        eef_link_pos, eef_link_orn = self._eef_links[arm].get_position_orientation()
         attachment_point_pos_local, _ = \
-            T.relative_pose_transform(attachment_point_pos, [0, 0, 0, 1], eef_link_pos, eef_link_orn)
+            T.relative_pose_transform(attachment_point_pos, IDENTITY_QUAT, eef_link_pos, eef_link_orn)
 
         # Create the joint
         joint_prim_path = f"{ag_link.prim_path}/ag_constraint"
@@ -1217,23 +1332,23 @@ class ManipulationRobot(BaseRobot):
         max_force = m.ASSIST_FORCE
         # joint_prim.GetAttribute("physics:breakForce").Set(max_force)
 
+        # Grab all joint positions at once, which are used for both the gripper and finger joint positions below
+        joint_positions = self.get_joint_positions()
         self._ag_obj_constraint_params[arm] = {
             "ag_obj_prim_path": ag_obj.prim_path,
             "ag_link_prim_path": ag_link.prim_path,
             "ag_joint_prim_path": joint_prim_path,
             "joint_type": joint_type,
-            "gripper_pos": self.get_joint_positions()[self.gripper_control_idx[arm]],
+            "gripper_pos": joint_positions[self._gripper_control_idx[arm]],
             "max_force": max_force,
             "attachment_point_pos_local": attachment_point_pos_local,
         }
         self._ag_obj_in_hand[arm] = ag_obj
-        self._ag_freeze_gripper[arm] = True
+        self._ag_freeze_gripper[self._arm_idx[arm]] = True
         # Disable collisions while picking things up
         # for finger_link in self.finger_links[arm]:
         #     finger_link.add_filtered_collision_pair(prim=ag_obj)
-        for joint in self.finger_joints[arm]:
-            j_val = joint.get_state()[0][0]
-            self._ag_freeze_joint_pos[arm][joint.joint_name] = j_val
+        self._ag_freeze_joint_pos[arm] = joint_positions[self._finger_joint_idx[arm]]
 
     def _dump_state(self):
         # Call super first
@@ -7,7 +7,7 @@ from omnigibson.sensors import create_sensor, SENSOR_PRIMS_TO_SENSOR_CLS, ALL_SE
 from omnigibson.objects.usd_object import USDObject
 from omnigibson.objects.controllable_object import ControllableObject
 from omnigibson.utils.gym_utils import GymObservable
-from omnigibson.utils.python_utils import classproperty
+from omnigibson.utils.python_utils import classproperty, LazyDict
 from omnigibson.utils.vision_utils import segmentation_to_rgb
 from omnigibson.utils.constants import PrimType
 from pxr import PhysxSchema
@@ -231,14 +231,14 @@ class BaseRobot(USDObject, ControllableObject, GymObservable):
     def _get_proprioception_dict(self):
         """
         Returns:
-            dict: keyword-mapped proprioception observations available for this robot.
-                Can be extended by subclasses
+            LazyDict: keyword-mapped proprioception observations available for this robot. Subclasses may extend this
+                and register expensive entries with set_lazy() so that they are only computed when actually requested
         """
         joint_positions = self.get_joint_positions(normalized=False)
         joint_velocities = self.get_joint_velocities(normalized=False)
         joint_efforts = self.get_joint_efforts(normalized=False)
         pos, ori = self.get_position(), self.get_rpy()
-        return dict(
+        return LazyDict(
             joint_qpos=joint_positions,
             joint_qpos_sin=np.sin(joint_positions),
             joint_qpos_cos=np.cos(joint_positions),
@@ -423,17 +423,23 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         if obj.fixed_base and obj.category != robot_macros.ROBOT_CATEGORY:
             # TODO: Remove building hotfix once asset collision meshes are fixed!!
             building_categories = {"walls", "floors", "ceilings"}
+            # These don't change across the fixed objects iterated over, so resolve them once
+            obj_is_building = obj.category in building_categories
+            obj_root_link = obj.root_link
+            obj_links = list(obj.links.values())
+            add_obj_filtered_collision_pair = obj_root_link.add_filtered_collision_pair
             for fixed_obj in self.fixed_objects.values():
                 # Filter out collisions between walls / ceilings / floors and ALL links of the other object
-                if obj.category in building_categories:
+                if obj_is_building:
                     for link in fixed_obj.links.values():
-                        obj.root_link.add_filtered_collision_pair(link)
+                        add_obj_filtered_collision_pair(link)
                 elif fixed_obj.category in building_categories:
-                    for link in obj.links.values():
-                        fixed_obj.root_link.add_filtered_collision_pair(link)
+                    add_fixed_obj_filtered_collision_pair = fixed_obj.root_link.add_filtered_collision_pair
+                    for link in obj_links:
+                        add_fixed_obj_filtered_collision_pair(link)
                 else:
                     # Only filter out root links
-                    obj.root_link.add_filtered_collision_pair(fixed_obj.root_link)
+                    add_obj_filtered_collision_pair(fixed_obj.root_link)
 
         # Add this object to our registry based on its type, if we want to register it
         if register:
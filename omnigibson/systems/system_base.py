@@ -1132,7 +1132,7 @@ def _create_system_from_metadata(system_name):
         particle_assets.remove("metadata.json")
         has_asset = len(particle_assets) > 0
         if has_asset:
-            model = sorted(particle_assets)[0]
+            model = min(particle_assets)
             asset_path = os.path.join(system_dir, model, "usd", f"{model}.usd")
         else:
             asset_path = None
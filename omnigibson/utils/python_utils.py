@@ -752,6 +752,143 @@ class SerializableNonInstance:
         return state_dict
 
 
+class LazyDict(dict):
+    """
+    Dictionary whose values can optionally be registered as zero-argument functions via set_lazy(). A lazy value is
+    only computed the first time its key is accessed, after which it is stored like any other value. Any operation
+    that requires all values (e.g.: iterating over values / items, copying) computes all remaining lazy values first
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_fcns = dict()
+
+    def set_lazy(self, key, fcn):
+        """
+        Registers a lazily-computed value for @key
+
+        Args:
+            key (any): Key to register
+            fcn (function): Zero-argument function returning the value corresponding to @key. Only called once, the
+                first time @key is accessed
+        """
+        super().pop(key, None)
+        self._lazy_fcns[key] = fcn
+
+    def _compute_all(self):
+        """
+        Computes all lazy values that have not been accessed yet
+        """
+        for key in tuple(self._lazy_fcns.keys()):
+            self[key]
+
+    def __missing__(self, key):
+        if key not in self._lazy_fcns:
+            raise KeyError(key)
+        val = self._lazy_fcns.pop(key)()
+        super().__setitem__(key, val)
+        return val
+
+    def __setitem__(self, key, value):
+        self._lazy_fcns.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if self._lazy_fcns.pop(key, None) is None:
+            super().__delitem__(key)
+
+    def __contains__(self, key):
+        return super().__contains__(key) or key in self._lazy_fcns
+
+    def __len__(self):
+        return super().__len__() + len(self._lazy_fcns)
+
+    def __iter__(self):
+        self._compute_all()
+        return super().__iter__()
+
+    def __repr__(self):
+        self._compute_all()
+        return super().__repr__()
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *args):
+        if key in self._lazy_fcns:
+            self[key]
+        return super().pop(key, *args)
+
+    def keys(self):
+        self._compute_all()
+        return super().keys()
+
+    def values(self):
+        self._compute_all()
+        return super().values()
+
+    def items(self):
+        self._compute_all()
+        return super().items()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        # Route through __setitem__ so that any overwritten lazy values are discarded
+        for key, val in dict(*args, **kwargs).items():
+            self[key] = val
+
+    def popitem(self):
+        self._compute_all()
+        return super().popitem()
+
+    def clear(self):
+        self._lazy_fcns.clear()
+        super().clear()
+
+    def copy(self):
+        self._compute_all()
+        return dict(super().items())
+
+    def __reversed__(self):
+        self._compute_all()
+        return super().__reversed__()
+
+    def __eq__(self, other):
+        self._compute_all()
+        if isinstance(other, LazyDict):
+            other._compute_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    # Values are computed on first access, so hashing is as unsupported as for a regular dict
+    __hash__ = None
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = self.copy()
+        new.update(other)
+        return new
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = dict(other)
+        new.update(self.copy())
+        return new
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
 class Wrapper:
     """
     Base class for all wrappers in OmniGibson
@@ -279,12 +279,23 @@ def raytest_batch(start_points, end_points, only_closest=True, ignore_bodies=Non
 
             Note that only "hit" = False exists in the dict if no hit was found
     """
+    # Convert the ignore lists into sets once here, rather than once per ray
+    ignore_bodies = None if ignore_bodies is None else frozenset(ignore_bodies)
+    ignore_collisions = None if ignore_collisions is None else frozenset(ignore_collisions)
+
+    # Compute all ray directions and lengths at once
+    start_points = np.array(start_points)
+    point_diffs = np.array(end_points) - start_points
+    distances = np.linalg.norm(point_diffs, axis=-1)
+    directions = point_diffs / distances.reshape(-1, 1)
+
     # For now, we do a naive for loop over individual raytests until a better API comes out
     results = []
-    for start_point, end_point in zip(start_points, end_points):
-        results.append(raytest(
+    for start_point, direction, distance in zip(start_points, directions, distances):
+        results.append(_raytest_direction(
             start_point=start_point,
-            end_point=end_point,
+            direction=direction,
+            distance=distance,
             only_closest=only_closest,
             ignore_bodies=ignore_bodies,
             ignore_collisions=ignore_collisions,
@@ -332,6 +343,41 @@ def raytest(
     distance = np.linalg.norm(point_diff)
     direction = point_diff / distance
 
+    return _raytest_direction(
+        start_point=start_point,
+        direction=direction,
+        distance=distance,
+        only_closest=only_closest,
+        ignore_bodies=ignore_bodies,
+        ignore_collisions=ignore_collisions,
+    )
+
+
+def _raytest_direction(
+    start_point,
+    direction,
+    distance,
+    only_closest=True,
+    ignore_bodies=None,
+    ignore_collisions=None,
+):
+    """
+    Computes raytest collision for ray cast from @start_point along unit vector @direction for @distance. See raytest()
+    for more info
+
+    Args:
+        start_point (3-array): (x,y,z) global start location of the ray
+        direction (3-array): (x,y,z) unit vector direction of the ray
+        distance (float): length of the ray
+        only_closest (bool): Whether we report the first (closest) hit from the ray or grab all hits
+        ignore_bodies (None or list of str): If specified, specifies absolute USD paths to rigid bodies
+            whose collisions should be ignored
+        ignore_collisions (None or list of str): If specified, specifies absolute USD paths to collision geoms
+            whose collisions should be ignored
+
+    Returns:
+        dict or list of dict: Results for this raytest. See raytest() for more info
+    """
     # For efficiency's sake, we handle special case of no ignore_bodies, ignore_collisions, and closest_hit
     if only_closest and ignore_bodies is None and ignore_collisions is None:
         return og.sim.psqi.raycast_closest(
@@ -342,8 +388,8 @@ def raytest(
     else:
         # Compose callback function for finding raycasts
         hits = []
-        ignore_bodies = set() if ignore_bodies is None else set(ignore_bodies)
-        ignore_collisions = set() if ignore_collisions is None else set(ignore_collisions)
+        ignore_bodies = frozenset() if ignore_bodies is None else frozenset(ignore_bodies)
+        ignore_collisions = frozenset() if ignore_collisions is None else frozenset(ignore_collisions)
 
         def callback(hit):
             # Only add to hits if we're not ignoring this body or collision
@@ -367,10 +413,10 @@ def raytest(
             reportFn=callback,
         )
 
-        # If we only want the closest, we need to sort these hits, otherwise we return them all
+        # If we only want the closest, we need to find the closest of these hits, otherwise we return them all
         if only_closest:
             # Return the empty hit dictionary if our ray did not hit anything, otherwise we return the closest
-            return {"hit": False} if len(hits) == 0 else sorted(hits, key=lambda hit: hit["distance"])[0]
+            return {"hit": False} if len(hits) == 0 else min(hits, key=lambda hit: hit["distance"])
         else:
             # Return all hits (list)
             return hits
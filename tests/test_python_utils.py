@@ -0,0 +1,134 @@
+from omnigibson.utils.python_utils import LazyDict
+
+import pytest
+
+
+def make_lazy_dict(calls):
+    # Lazy dict with one regular entry "a" and one lazy entry "b" that records every time it is evaluated
+    dic = LazyDict(a=1)
+
+    def compute_b():
+        calls.append("b")
+        return 5
+
+    dic.set_lazy("b", compute_b)
+    return dic
+
+
+def test_lazy_dict_evaluates_once():
+    calls = []
+    dic = make_lazy_dict(calls)
+
+    # Registering or checking for a lazy key does not evaluate it
+    assert "b" in dic
+    assert len(dic) == 2
+    assert calls == []
+
+    # First access evaluates, subsequent accesses reuse the memoized value
+    assert dic["b"] == 5
+    assert dic.get("b") == 5
+    assert dic["b"] == 5
+    assert calls == ["b"]
+
+    # Missing keys still behave like a regular dict
+    assert dic.get("c") is None
+    assert dic.get("c", 3) == 3
+    with pytest.raises(KeyError):
+        dic["c"]
+
+
+def test_lazy_dict_overwrite():
+    calls = []
+
+    # Overwriting via __setitem__ discards the pending lazy value
+    dic = make_lazy_dict(calls)
+    dic["b"] = 7
+    assert dic["b"] == 7
+    assert len(dic) == 2
+
+    # Same for update()
+    dic = make_lazy_dict(calls)
+    dic.update({"b": 8})
+    assert dic["b"] == 8
+    assert len(dic) == 2
+
+    # Re-registering a computed key as lazy replaces its value
+    dic = make_lazy_dict(calls)
+    dic.set_lazy("a", lambda: 2)
+    assert dic["a"] == 2
+    assert len(dic) == 2
+
+    # None of the overwritten lazy values were ever evaluated
+    assert calls == []
+
+    # setdefault() respects a pending lazy value
+    dic = make_lazy_dict(calls)
+    assert dic.setdefault("b", 9) == 5
+    assert calls == ["b"]
+
+
+def test_lazy_dict_iteration_forces_evaluation():
+    for fcn in (list, lambda dic: list(dic.keys()), lambda dic: list(dic.values()), lambda dic: list(dic.items())):
+        calls = []
+        dic = make_lazy_dict(calls)
+        fcn(dic)
+        assert calls == ["b"]
+
+    calls = []
+    dic = make_lazy_dict(calls)
+    assert list(dic) == ["a", "b"]
+    assert list(dic.values()) == [1, 5]
+    assert list(dic.items()) == [("a", 1), ("b", 5)]
+    assert calls == ["b"]
+
+
+def test_lazy_dict_copy_and_equality():
+    calls = []
+    dic = make_lazy_dict(calls)
+    copied = dic.copy()
+    assert type(copied) is dict
+    assert copied == {"a": 1, "b": 5}
+    assert calls == ["b"]
+
+    # Equality evaluates any pending lazy values, and works from either side
+    assert make_lazy_dict(calls) == {"a": 1, "b": 5}
+    assert {"a": 1, "b": 5} == make_lazy_dict(calls)
+    assert make_lazy_dict(calls) != {"a": 1, "b": 6}
+    assert make_lazy_dict(calls) == make_lazy_dict(calls)
+
+    # Merging includes lazy values
+    assert make_lazy_dict(calls) | {"c": 3} == {"a": 1, "b": 5, "c": 3}
+    assert {"c": 3} | make_lazy_dict(calls) == {"a": 1, "b": 5, "c": 3}
+    assert dict(make_lazy_dict(calls)) == {"a": 1, "b": 5}
+    assert {**make_lazy_dict(calls)} == {"a": 1, "b": 5}
+
+
+def test_lazy_dict_pop_and_del():
+    # Popping an unevaluated key evaluates and returns it
+    calls = []
+    dic = make_lazy_dict(calls)
+    assert dic.pop("b") == 5
+    assert calls == ["b"]
+    assert "b" not in dic
+    assert len(dic) == 1
+    assert dic.pop("b", None) is None
+    with pytest.raises(KeyError):
+        dic.pop("b")
+
+    # Deleting an unevaluated key removes it without evaluating it
+    calls = []
+    dic = make_lazy_dict(calls)
+    del dic["b"]
+    assert calls == []
+    assert "b" not in dic
+    assert len(dic) == 1
+    assert dic == {"a": 1}
+    with pytest.raises(KeyError):
+        del dic["b"]
+
+    # popitem() includes lazy entries
+    calls = []
+    dic = make_lazy_dict(calls)
+    assert dic.popitem() == ("b", 5)
+    assert calls == ["b"]
+    assert dic == {"a": 1}